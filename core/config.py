@@ -1,84 +1,239 @@
-"""Persistent settings management using QSettings."""
+"""Persistent settings management backed by a small JSON file."""
 
-from PyQt6.QtCore import QSettings
+import json
+import os
+import sys
+from typing import Any, Dict, Optional
+
+from PyQt6.QtCore import (
+    QCoreApplication,
+    QObject,
+    QSettings,
+    QStandardPaths,
+    QThread,
+    QTimer,
+    pyqtSignal,
+    pyqtSlot,
+)
 
 
 APP_NAME = "BulkEmailSender"
 ORG_NAME = "ResendMailer"
 
+CONFIG_FILENAME = "config.json"
 
-class AppConfig:
-    """Wrapper around QSettings for persistent key-value storage."""
+_FLUSH_DELAY_MS = 500
+# Failed writes are retried with a doubling delay up to this cap
+_MAX_RETRY_DELAY_MS = 60_000
+
+# Setting keys, interned once so cache and QSettings lookups reuse them
+_K_API_KEY = sys.intern("api_key")
+_K_FROM_EMAIL = sys.intern("from_email")
+_K_FROM_NAME = sys.intern("from_name")
+_K_SUBJECT = sys.intern("subject")
+_K_REPLY_TO = sys.intern("reply_to")
+_K_DELAY_SECONDS = sys.intern("delay_seconds")
+_K_HTML_BODY = sys.intern("html_body")
+
+_MISSING = object()
+
+
+def _config_path() -> str:
+    base = QStandardPaths.writableLocation(
+        QStandardPaths.StandardLocation.AppDataLocation
+    )
+    return os.path.join(base, CONFIG_FILENAME)
+
+
+def _load(path: str) -> Dict[str, Any]:
+    try:
+        with open(path, encoding="utf-8") as fh:
+            data = json.load(fh)
+    except FileNotFoundError:
+        return _load_legacy()
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def _load_legacy() -> Dict[str, Any]:
+    """Pick up values saved by earlier QSettings-based versions."""
+    settings = QSettings(ORG_NAME, APP_NAME)
+    return {key: settings.value(key) for key in settings.allKeys()}
+
+
+class _ConfigWriter(QObject):
+    """Writes config snapshots to disk on a dedicated thread."""
 
-    def __init__(self) -> None:
-        self._settings = QSettings(ORG_NAME, APP_NAME)
+    # dict snapshot to persist, or None to stop the thread
+    submit = pyqtSignal(object)
+    # emitted when a snapshot could not be written
+    failed = pyqtSignal()
+
+    def __init__(self, path: str) -> None:
+        super().__init__()
+        self._path = path
+        self.submit.connect(self._write)
+
+    @pyqtSlot(object)
+    def _write(self, data: Optional[Dict[str, Any]]) -> None:
+        if data is None:
+            self.thread().quit()
+            return
+        tmp = self._path + ".tmp"
+        try:
+            os.makedirs(os.path.dirname(self._path), exist_ok=True)
+            with open(tmp, "w", encoding="utf-8") as fh:
+                json.dump(data, fh, ensure_ascii=False, indent=2)
+            # Atomic on POSIX and Windows: readers see the old or new file
+            os.replace(tmp, self._path)
+        except (OSError, TypeError, ValueError):
+            # Must not escape a slot; the owner marks its data dirty again
+            self.failed.emit()
+
+
+class AppConfig:
+    """
+    Persistent key-value storage kept in memory and saved as JSON.
+
+    The file is read once on startup.  Changes are written as a single
+    atomic snapshot on a background thread shortly after the last change,
+    so disk I/O never blocks the UI.  Anything unsaved is written out when
+    the application quits.
+    """
+
+    def __init__(self, path: Optional[str] = None) -> None:
+        self._path = path or _config_path()
+        self._data: Dict[str, Any] = _load(self._path)
+        self._dirty = False
+
+        self._flush_timer = QTimer()
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(_FLUSH_DELAY_MS)
+        self._flush_timer.timeout.connect(self.flush)
+
+        self._writer_thread = QThread()
+        self._writer = _ConfigWriter(self._path)
+        self._writer.moveToThread(self._writer_thread)
+        self._writer.failed.connect(self._on_write_failed)
+        self._writer_thread.start()
+
+        app = QCoreApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self.close)
+
+    # ── public ───────────────────────────────────────────────────────────
+
+    def flush(self) -> None:
+        """Hand a snapshot of unsaved changes to the writer thread right away."""
+        self._flush_timer.stop()
+        if not self._dirty:
+            return
+        self._writer.submit.emit(dict(self._data))
+        self._dirty = False
+
+    def close(self) -> None:
+        """Flush pending changes and wait until the writer has stored them."""
+        if not self._writer_thread.isRunning():
+            return
+        self.flush()
+        # Queued after every earlier snapshot, so all of them land first
+        self._writer.submit.emit(None)
+        self._writer_thread.wait()
 
     # ── helpers ──────────────────────────────────────────────────────────
 
-    def _get(self, key: str, default: str = "") -> str:
-        return str(self._settings.value(key, default))
+    def _on_write_failed(self) -> None:
+        # The data is still in memory; try again after a growing delay
+        self._dirty = True
+        self._flush_timer.setInterval(
+            min(self._flush_timer.interval() * 2, _MAX_RETRY_DELAY_MS)
+        )
+        self._flush_timer.start()
+
+    def _get(self, key: str, default: Any, type_: type) -> Any:
+        value = self._data.get(key, _MISSING)
+        if value is _MISSING or value is None:
+            return default
+        if isinstance(value, type_):
+            return value
+        # Values migrated from QSettings may come back as strings
+        try:
+            value = type_(value)
+        except (TypeError, ValueError):
+            return default
+        self._data[key] = value
+        return value
+
+    def _get_str(self, key: str, default: str = "") -> str:
+        return self._get(key, default, str)
 
-    def _set(self, key: str, value: str) -> None:
-        self._settings.setValue(key, value)
+    def _get_float(self, key: str, default: float = 0.0) -> float:
+        return self._get(key, default, float)
+
+    def _set(self, key: str, value: Any) -> None:
+        # Skip no-op writes so an unchanged form never touches the disk
+        if self._data.get(key, _MISSING) == value:
+            return
+        self._data[key] = value
+        self._dirty = True
+        self._flush_timer.setInterval(_FLUSH_DELAY_MS)
+        self._flush_timer.start()
 
     # ── public properties ────────────────────────────────────────────────
 
     @property
     def api_key(self) -> str:
-        return self._get("api_key")
+        return self._get_str(_K_API_KEY)
 
     @api_key.setter
     def api_key(self, value: str) -> None:
-        self._set("api_key", value)
+        self._set(_K_API_KEY, value)
 
     @property
     def from_email(self) -> str:
-        return self._get("from_email")
+        return self._get_str(_K_FROM_EMAIL)
 
     @from_email.setter
     def from_email(self, value: str) -> None:
-        self._set("from_email", value)
+        self._set(_K_FROM_EMAIL, value)
 
     @property
     def from_name(self) -> str:
-        return self._get("from_name")
+        return self._get_str(_K_FROM_NAME)
 
     @from_name.setter
     def from_name(self, value: str) -> None:
-        self._set("from_name", value)
+        self._set(_K_FROM_NAME, value)
 
     @property
     def subject(self) -> str:
-        return self._get("subject")
+        return self._get_str(_K_SUBJECT)
 
     @subject.setter
     def subject(self, value: str) -> None:
-        self._set("subject", value)
+        self._set(_K_SUBJECT, value)
 
     @property
     def reply_to(self) -> str:
-        return self._get("reply_to")
+        return self._get_str(_K_REPLY_TO)
 
     @reply_to.setter
     def reply_to(self, value: str) -> None:
-        self._set("reply_to", value)
+        self._set(_K_REPLY_TO, value)
 
     @property
     def delay_seconds(self) -> float:
-        val = self._settings.value("delay_seconds", 5.0)
-        try:
-            return float(val)  # type: ignore[arg-type]
-        except (TypeError, ValueError):
-            return 5.0
+        return self._get_float(_K_DELAY_SECONDS, 5.0)
 
     @delay_seconds.setter
     def delay_seconds(self, value: float) -> None:
-        self._settings.setValue("delay_seconds", value)
+        self._set(_K_DELAY_SECONDS, float(value))
 
     @property
     def html_body(self) -> str:
-        return self._get("html_body")
+        return self._get_str(_K_HTML_BODY)
 
     @html_body.setter
     def html_body(self, value: str) -> None:
-        self._set("html_body", value)
+        self._set(_K_HTML_BODY, value)
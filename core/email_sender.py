@@ -2,15 +2,22 @@
 
 from __future__ import annotations
 
+import json
+import queue
 import random
 import re
+import threading
 import time
+from collections.abc import Sized
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import List
+from html.parser import HTMLParser
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+from urllib.parse import quote
 
-import resend
-from bs4 import BeautifulSoup
-from PyQt6.QtCore import QThread, pyqtSignal
+import requests
+from requests.adapters import HTTPAdapter, Retry
+from PyQt6.QtCore import QMutex, QMutexLocker, QThread, QWaitCondition, pyqtSignal
 
 
 # ── data types ───────────────────────────────────────────────────────────────
@@ -24,34 +31,254 @@ class EmailResult:
     message: str  # resend id on success, error text on failure
 
 
+@dataclass
+class SendJob:
+    """One bulk send: message content, sender details and recipients."""
+
+    api_key: str
+    from_name: str
+    from_email: str
+    subject: str
+    html_body: str
+    # Consumed lazily while sending, so generators and open files work too
+    recipients: Iterable[str]
+    delay_seconds: float = 5.0
+    reply_to: str = ""
+    total: Optional[int] = None  # None when the recipient count is unknown
+
+    def __post_init__(self) -> None:
+        self.api_key = self.api_key.strip()
+        self.from_name = self.from_name.strip()
+        self.from_email = self.from_email.strip()
+        self.subject = self.subject.strip()
+        self.reply_to = self.reply_to.strip()
+        self.delay_seconds = max(self.delay_seconds, 1.0)  # floor at 1 s
+        if self.total is None and isinstance(self.recipients, Sized):
+            self.total = sum(1 for r in self.recipients if r.strip())
+
+
 # ── helpers ──────────────────────────────────────────────────────────────────
 
-_EMAIL_RE = re.compile(r"^[a-zA-Z0-9._%+\-]+@[a-zA-Z0-9.\-]+\.[a-zA-Z]{2,}$")
+RESEND_API_URL = "https://api.resend.com/emails"
+
+_MAX_SEND_WORKERS = 8
+_REQUEST_TIMEOUT = 30  # seconds
+
+# Results are sent to the UI once this many are queued or this much time passed
+_RESULT_BATCH_SIZE = 50
+_RESULT_BATCH_INTERVAL = 0.25  # seconds
+
+_EMAIL_RE = re.compile(
+    r"^[a-zA-Z0-9._%+\-]+@[a-zA-Z0-9.\-]+\.[a-zA-Z]{2,}\Z", re.ASCII
+)
+_match_email = _EMAIL_RE.match
+
+_BLANK_LINES_RE = re.compile(r"\n{3,}")
+
+# Per-recipient placeholders, e.g. ``{{email}}``
+_PLACEHOLDER_RE = re.compile(r"\{\{\s*(\w+)\s*\}\}")
+TEMPLATE_FIELDS = frozenset({"email"})
 
 
 def is_valid_email(email: str) -> bool:
-    return bool(_EMAIL_RE.match(email.strip()))
+    """Check an already-stripped address against the basic email pattern."""
+    return _match_email(email) is not None
+
+
+def compile_template(source: str) -> Optional[Callable[[Dict[str, str]], str]]:
+    """
+    Compile the ``{{field}}`` placeholders in *source* into a render function.
+
+    The text is scanned once; rendering a recipient is then a single join of
+    the literal pieces and context values.  Unknown fields are left as-is.
+    Returns None when *source* has no supported placeholder.
+    """
+    parts: List[str] = []
+    slots: List[Tuple[int, str]] = []  # (index into parts, field name)
+    pos = 0
+    for m in _PLACEHOLDER_RE.finditer(source):
+        if m.group(1) not in TEMPLATE_FIELDS:
+            continue
+        parts.append(source[pos:m.start()])
+        slots.append((len(parts), m.group(1)))
+        parts.append("")
+        pos = m.end()
+    if not slots:
+        return None
+    parts.append(source[pos:])
+    join = "".join
+
+    def render(ctx: Dict[str, str]) -> str:
+        out = parts[:]
+        for i, field in slots:
+            out[i] = ctx[field]
+        return join(out)
+
+    return render
+
+
+# Rejection reasons yielded by _classify_recipients
+_DUPLICATE = "Duplicate recipient"
+_INVALID = "Invalid email format"
+
+
+def _classify_recipients(
+    recipients: Iterable[str],
+) -> Iterator[Tuple[str, Optional[str]]]:
+    """
+    Strip, de-duplicate (case-insensitively) and validate lazily.
+
+    Yields ``(recipient, reason)`` where *reason* is None for an address to
+    send to; blank entries are skipped.
+    """
+    seen: Set[str] = set()
+    for recipient in recipients:
+        recipient = recipient.strip()
+        if not recipient:
+            continue
+        key = recipient.lower()
+        if key in seen:
+            yield recipient, _DUPLICATE
+        elif _match_email(recipient) is None:
+            yield recipient, _INVALID
+        else:
+            seen.add(key)
+            yield recipient, None
+
+
+def clean_recipients(recipients: Iterable[str]) -> Tuple[List[str], int, int]:
+    """
+    Strip, de-duplicate (case-insensitively) and validate in a single pass.
+
+    Returns ``(valid, duplicate_count, invalid_count)``; blank entries are
+    ignored.
+    """
+    valid: List[str] = []
+    duplicates = invalid = 0
+    for recipient, reason in _classify_recipients(recipients):
+        if reason is None:
+            valid.append(recipient)
+        elif reason is _DUPLICATE:
+            duplicates += 1
+        else:
+            invalid += 1
+    return valid, duplicates, invalid
+
+
+class _TextExtractor(HTMLParser):
+    """
+    Single-pass HTML → text converter.
+
+    Keeps only the stripped, non-empty text nodes outside <script>/<style>,
+    so no parse tree is ever built.
+    """
+
+    _SKIP_TAGS = frozenset({"script", "style"})
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._out: List[str] = []
+        self._skip_depth = 0
+
+    def handle_starttag(self, tag: str, attrs) -> None:
+        if tag in self._SKIP_TAGS:
+            self._skip_depth += 1
+
+    def handle_endtag(self, tag: str) -> None:
+        if tag in self._SKIP_TAGS and self._skip_depth:
+            self._skip_depth -= 1
+
+    def handle_data(self, data: str) -> None:
+        if self._skip_depth:
+            return
+        data = data.strip()
+        if data:
+            self._out.append(data)
+
+    def get_text(self) -> str:
+        return "\n".join(self._out)
 
 
 def html_to_plain_text(html: str) -> str:
     """Convert HTML to a readable plain-text fallback (anti-spam best practice)."""
-    soup = BeautifulSoup(html, "html.parser")
+    parser = _TextExtractor()
+    parser.feed(html)
+    parser.close()
 
-    # Remove script / style tags entirely
-    for tag in soup(["script", "style"]):
-        tag.decompose()
-
-    text = soup.get_text(separator="\n", strip=True)
+    text = parser.get_text()
     # Collapse multiple blank lines
-    text = re.sub(r"\n{3,}", "\n\n", text)
+    text = _BLANK_LINES_RE.sub("\n\n", text)
     return text.strip()
 
 
+class ResendAPIError(Exception):
+    """Raised when the Resend API rejects a send request."""
+
+
+def _pooled_session(api_key: str, pool_size: int) -> requests.Session:
+    """Session that keeps connections to the API alive across sends."""
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=pool_size,
+        pool_maxsize=pool_size,
+        # POST is not retried on status codes, only on failed connects
+        max_retries=Retry(
+            total=2, backoff_factor=0.3, status_forcelist=[429, 502, 503, 504]
+        ),
+    )
+    session.mount("https://", adapter)
+    session.headers.update({
+        "Authorization": f"Bearer {api_key}",
+        "Content-Type": "application/json",
+    })
+    return session
+
+
+def _post_email(session: requests.Session, body: bytes) -> str:
+    """POST a pre-encoded JSON body to the Resend API and return the email id."""
+    response = session.post(RESEND_API_URL, data=body, timeout=_REQUEST_TIMEOUT)
+    try:
+        payload = response.json()
+    except ValueError:
+        payload = {}
+    if not response.ok:
+        message = payload.get("message") if isinstance(payload, dict) else None
+        raise ResendAPIError(message or f"HTTP {response.status_code}")
+    return payload.get("id", "unknown") if isinstance(payload, dict) else "unknown"
+
+
+class _TokenBucket:
+    """Thread-safe token bucket refilled at ``rate`` tokens per second."""
+
+    def __init__(self, rate: float, capacity: int = 1) -> None:
+        self._rate = rate
+        self._capacity = float(capacity)
+        self._tokens = 1.0
+        self._stamp = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Take one token and return how many seconds to wait before using it."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self._capacity, self._tokens + (now - self._stamp) * self._rate
+            )
+            self._stamp = now
+            self._tokens -= 1.0
+            if self._tokens >= 0.0:
+                return 0.0
+            return -self._tokens / self._rate
+
+
 # ── worker ───────────────────────────────────────────────────────────────────
 
 class EmailSenderWorker(QThread):
     """
-    Sends emails sequentially with a configurable delay between each send.
+    Long-lived thread that runs queued send jobs one after another.
+
+    Each job sends one recipient at a time, starting at most one send per
+    configured delay; slow API calls overlap on a small thread pool.
 
     Anti-spam best practices applied:
     - Plain-text alternative auto-generated from HTML
@@ -63,147 +290,250 @@ class EmailSenderWorker(QThread):
     """
 
     # ── signals ──────────────────────────────────────────────────────────
-    progress = pyqtSignal(int, int)            # (current_index, total)
-    email_sent = pyqtSignal(object)            # EmailResult
+    progress = pyqtSignal(int, int)            # (current_index, total or -1)
+    email_sent_batch = pyqtSignal(list)        # list[EmailResult]
     finished_all = pyqtSignal(int, int)        # (success_count, fail_count)
     log_message = pyqtSignal(str)              # informational log line
     error_occurred = pyqtSignal(str)           # fatal / config error
 
-    def __init__(
-        self,
-        api_key: str,
-        from_name: str,
-        from_email: str,
-        subject: str,
-        html_body: str,
-        recipients: List[str],
-        delay_seconds: float = 5.0,
-        reply_to: str = "",
-        parent=None,
-    ) -> None:
+    def __init__(self, parent=None) -> None:
         super().__init__(parent)
 
-        self.api_key = api_key.strip()
-        self.from_name = from_name.strip()
-        self.from_email = from_email.strip()
-        self.subject = subject.strip()
-        self.html_body = html_body
-        self.recipients = recipients
-        self.delay_seconds = max(delay_seconds, 1.0)  # floor at 1 s
-        self.reply_to = reply_to.strip()
+        # Pending jobs; None tells the thread to exit
+        self._jobs: "queue.Queue[Optional[SendJob]]" = queue.Queue()
 
         self._stop_requested = False
+        self._stop_mutex = QMutex()
+        self._stop_cond = QWaitCondition()
 
     # ── public ───────────────────────────────────────────────────────────
 
-    def request_stop(self) -> None:
-        self._stop_requested = True
+    def submit(self, job: SendJob) -> None:
+        """Queue *job*; it starts once any earlier job has finished."""
+        # Cleared here rather than on dequeue so a Stop issued before the
+        # job starts still applies to it
+        with QMutexLocker(self._stop_mutex):
+            self._stop_requested = False
+        self._jobs.put(job)
+
+    def cancel_current_job(self) -> None:
+        """Stop the job that is sending, or the submitted one if not yet started."""
+        with QMutexLocker(self._stop_mutex):
+            self._stop_requested = True
+            self._stop_cond.wakeAll()
+
+    def shutdown(self) -> None:
+        """Cancel the current job and let the thread exit."""
+        self.cancel_current_job()
+        self._jobs.put(None)
+
+    # ── helpers ──────────────────────────────────────────────────────────
+
+    def _wait_for_stop(self, seconds: float) -> bool:
+        """Block for up to *seconds*; return True early if a stop was requested."""
+        with QMutexLocker(self._stop_mutex):
+            if not self._stop_requested:
+                self._stop_cond.wait(self._stop_mutex, int(seconds * 1000))
+            return self._stop_requested
 
     # ── main loop ────────────────────────────────────────────────────────
 
-    def run(self) -> None:  # noqa: C901 – acceptable for a worker
+    def run(self) -> None:
+        while True:
+            job = self._jobs.get()
+            if job is None:
+                break
+            # An escaping error must not end the thread, or later jobs
+            # would be silently dropped
+            try:
+                self._run_job(job)
+            except Exception as exc:
+                self.error_occurred.emit(f"Sending failed: {exc}")
+                self.finished_all.emit(0, 0)
+
+    def _run_job(self, job: SendJob) -> None:  # noqa: C901 – acceptable for a worker
         # Validate inputs
-        if not self.api_key:
+        if not job.api_key:
             self.error_occurred.emit("API key is empty.")
             return
-        if not self.from_email:
+        if not job.from_email:
             self.error_occurred.emit("Sender email is empty.")
             return
-        if not self.subject:
+        if not job.subject:
             self.error_occurred.emit("Subject line is empty.")
             return
-        if not self.html_body.strip():
+        if not job.html_body.strip():
             self.error_occurred.emit("Email body (HTML) is empty.")
             return
-        if not self.recipients:
+        total = job.total
+        if total == 0:
             self.error_occurred.emit("Recipient list is empty.")
             return
 
-        resend.api_key = self.api_key
-
         # Build the "from" field: "Name <email>" or just email
         sender = (
-            f"{self.from_name} <{self.from_email}>"
-            if self.from_name
-            else self.from_email
+            f"{job.from_name} <{job.from_email}>"
+            if job.from_name
+            else job.from_email
         )
 
         # Generate plain-text alternative once
-        plain_text = html_to_plain_text(self.html_body)
+        plain_text = html_to_plain_text(job.html_body)
+        # Personalised bodies are rendered per send; static ones are encoded once
+        render_html = compile_template(job.html_body)
+        render_text = compile_template(plain_text)
+        personalised = render_html is not None
 
-        total = len(self.recipients)
         success_count = 0
         fail_count = 0
-
-        self.log_message.emit(
-            f"Starting to send {total} email(s) with ~{self.delay_seconds}s delay…"
+        done = 0
+        counter_lock = threading.Lock()
+
+        # Results are handed to the UI in batches to keep cross-thread
+        # signal traffic down on large sends.
+        batch: List[EmailResult] = []
+        batch_lines: List[str] = []
+        last_flush = time.monotonic()
+        progress_total = total if total is not None else -1
+        # True while the submitter sleeps out a rate-limit delay; results
+        # arriving then are handed on at once instead of waiting for the
+        # next record() call.
+        idling = False
+
+        def flush_batch() -> None:
+            # Caller must hold counter_lock
+            nonlocal last_flush
+            last_flush = time.monotonic()
+            if not batch:
+                return
+            if batch_lines:
+                self.log_message.emit("\n".join(batch_lines))
+                batch_lines.clear()
+            self.email_sent_batch.emit(batch[:])
+            batch.clear()
+            self.progress.emit(done, progress_total)
+
+        def record(result: EmailResult, line: str = "") -> None:
+            nonlocal done, success_count, fail_count
+            with counter_lock:
+                if result.success:
+                    success_count += 1
+                else:
+                    fail_count += 1
+                done += 1
+
+                if line:
+                    shown_total = total if total is not None else "?"
+                    batch_lines.append(f"[{done}/{shown_total}] {line}")
+                batch.append(result)
+                if (
+                    idling
+                    or len(batch) >= _RESULT_BATCH_SIZE
+                    or time.monotonic() - last_flush >= _RESULT_BATCH_INTERVAL
+                ):
+                    flush_batch()
+
+        # Fields shared by every message are JSON-encoded once; per send only
+        # the recipient-specific fields are encoded and spliced in.
+        shared: Dict[str, str] = {
+            "from": sender,
+            "subject": job.subject,
+        }
+        if not personalised:
+            shared["html"] = job.html_body
+            shared["text"] = plain_text
+        if job.reply_to:
+            shared["reply_to"] = job.reply_to
+        # '{"from": …, "text": …'  – left open for the per-send fields
+        shared_json = json.dumps(shared, ensure_ascii=False)[:-1].encode("utf-8")
+        list_unsubscribe = (
+            f"<mailto:{quote(job.from_email, safe='@')}?subject=unsubscribe>"
         )
+        campaign_tag = {"name": "campaign", "value": "bulk_send"}
+        batch_ts = int(time.time())
 
-        for idx, recipient in enumerate(self.recipients):
+        def send_one(idx: int, recipient: str) -> None:
             if self._stop_requested:
-                self.log_message.emit("Sending stopped by user.")
-                break
+                return
 
-            recipient = recipient.strip()
-            if not recipient:
-                continue
-
-            if not is_valid_email(recipient):
-                result = EmailResult(recipient, False, "Invalid email format")
-                self.email_sent.emit(result)
-                fail_count += 1
-                self.progress.emit(idx + 1, total)
-                continue
-
-            # ── build params ─────────────────────────────────────────
-            params: resend.Emails.SendParams = {
-                "from": sender,
-                "to": [recipient],
-                "subject": self.subject,
-                "html": self.html_body,
-                "text": plain_text,
-                "headers": {
-                    "List-Unsubscribe": f"<mailto:{self.from_email}?subject=unsubscribe>",
-                    "X-Entity-Ref-ID": f"bulk-{int(time.time())}-{idx}",
-                },
-                "tags": [
-                    {"name": "campaign", "value": "bulk_send"},
-                    {"name": "batch_index", "value": str(idx)},
-                ],
-            }
-
-            if self.reply_to:
-                params["reply_to"] = self.reply_to
-
-            # ── send ─────────────────────────────────────────────────
             try:
-                response = resend.Emails.send(params)
-                email_id = response.get("id", "unknown") if isinstance(response, dict) else str(response)
+                # ── build body ───────────────────────────────────────
+                fields = {
+                    "to": [recipient],
+                    "headers": {
+                        "List-Unsubscribe": list_unsubscribe,
+                        "X-Entity-Ref-ID": f"bulk-{batch_ts}-{idx}",
+                    },
+                    "tags": [
+                        campaign_tag,
+                        {"name": "batch_index", "value": str(idx)},
+                    ],
+                }
+                if personalised:
+                    ctx = {"email": recipient}
+                    fields["html"] = render_html(ctx)
+                    fields["text"] = (
+                        render_text(ctx) if render_text is not None else plain_text
+                    )
+                per_send = json.dumps(fields, ensure_ascii=False).encode("utf-8")
+                body = shared_json + b"," + per_send[1:]
+
+                # ── send ─────────────────────────────────────────────
+                email_id = _post_email(session, body)
                 result = EmailResult(recipient, True, email_id)
-                success_count += 1
-                self.log_message.emit(
-                    f"[{idx + 1}/{total}] ✓ {recipient} → {email_id}"
-                )
+                line = f"✓ {recipient} → {email_id}"
             except Exception as exc:
                 result = EmailResult(recipient, False, str(exc))
-                fail_count += 1
-                self.log_message.emit(
-                    f"[{idx + 1}/{total}] ✗ {recipient} → {exc}"
-                )
-
-            self.email_sent.emit(result)
-            self.progress.emit(idx + 1, total)
-
-            # ── rate-limit delay with jitter ─────────────────────────
-            if idx < total - 1 and not self._stop_requested:
-                jitter = random.uniform(-0.5, 0.5)
-                sleep_time = max(1.0, self.delay_seconds + jitter)
-                self.log_message.emit(f"  waiting {sleep_time:.1f}s …")
-                # Sleep in small increments so we can react to stop requests
-                slept = 0.0
-                while slept < sleep_time and not self._stop_requested:
-                    step = min(0.25, sleep_time - slept)
-                    time.sleep(step)
-                    slept += step
+                line = f"✗ {recipient} → {exc}"
+
+            record(result, line)
+
+        count = f"{total} email(s)" if total is not None else "emails"
+        self.log_message.emit(
+            f"Starting to send {count} with ~{job.delay_seconds}s delay…"
+        )
+
+        # Sends run concurrently so slow API round-trips overlap, while the
+        # token bucket keeps the start rate at one email per delay period.
+        rate = 1.0 / job.delay_seconds
+        bucket = _TokenBucket(rate, capacity=max(1, int(rate * 2)))
+        session = _pooled_session(job.api_key, _MAX_SEND_WORKERS)
+        idx = 0
+
+        with session, ThreadPoolExecutor(
+            max_workers=min(_MAX_SEND_WORKERS, total or _MAX_SEND_WORKERS),
+            thread_name_prefix="resend-send",
+        ) as pool:
+            # Recipients are consumed lazily; invalid and duplicate rows are
+            # reported straight away and never wait for a rate-limit slot.
+            for recipient, reason in _classify_recipients(job.recipients):
+                if self._stop_requested:
+                    break
+                if reason is not None:
+                    record(EmailResult(recipient, False, reason))
+                    continue
+
+                # ── rate-limit delay with jitter ─────────────────────
+                wait = bucket.reserve()
+                if wait > 0:
+                    sleep_time = wait + random.uniform(0.0, 0.5)
+                    self.log_message.emit(f"  waiting {sleep_time:.1f}s …")
+                    with counter_lock:
+                        flush_batch()
+                        idling = True
+                    stopped = self._wait_for_stop(sleep_time)
+                    with counter_lock:
+                        idling = False
+                    if stopped:
+                        break
+
+                pool.submit(send_one, idx, recipient)
+                idx += 1
+
+        with counter_lock:
+            flush_batch()
+
+        if self._stop_requested:
+            self.log_message.emit("Sending stopped by user.")
 
         self.finished_all.emit(success_count, fail_count)
@@ -0,0 +1,83 @@
+"""Inline confirmation strip shown in place of a modal dialog."""
+
+from typing import Callable, Optional
+
+from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtWidgets import QFrame, QHBoxLayout, QLabel, QPushButton
+
+
+class ConfirmBanner(QFrame):
+    """
+    Hidden-by-default bar asking the user to confirm a send.
+
+    Built once and re-used, so confirming never opens a dialog or spins a
+    nested event loop on the UI thread.
+    """
+
+    # emitted when a shown banner is dismissed without sending
+    cancelled = pyqtSignal()
+
+    def __init__(self, parent=None) -> None:
+        super().__init__(parent)
+        self.setObjectName("confirmBanner")
+        self._on_accept: Optional[Callable[[], None]] = None
+
+        layout = QHBoxLayout(self)
+        layout.setContentsMargins(12, 8, 12, 8)
+        layout.setSpacing(10)
+
+        self._label = QLabel()
+        self._label.setObjectName("confirmText")
+        self._label.setWordWrap(True)
+        layout.addWidget(self._label, stretch=1)
+
+        self._accept_btn = QPushButton("Send")
+        self._accept_btn.setObjectName("confirmAcceptBtn")
+        self._accept_btn.setCursor(Qt.CursorShape.PointingHandCursor)
+        self._accept_btn.clicked.connect(self._accept)
+        layout.addWidget(self._accept_btn)
+
+        self._cancel_btn = QPushButton("Cancel")
+        self._cancel_btn.setObjectName("confirmCancelBtn")
+        self._cancel_btn.setCursor(Qt.CursorShape.PointingHandCursor)
+        self._cancel_btn.clicked.connect(self.dismiss)
+        layout.addWidget(self._cancel_btn)
+
+        self.hide()
+
+    # ── public ───────────────────────────────────────────────────────────
+
+    def show_for(
+        self,
+        total: int,
+        est: float,
+        on_accept: Callable[[], None],
+        note: str = "",
+    ) -> None:
+        """Ask to send to *total* recipients taking about *est* seconds."""
+        m, s = int(est // 60), int(est % 60)
+        text = f"Send to {total} recipient(s)? Estimated time: {m}m {s}s."
+        if note:
+            text += f" {note}"
+        self._label.setText(text)
+        self._on_accept = on_accept
+        self.show()
+        self._accept_btn.setFocus()
+
+    def dismiss(self) -> None:
+        """Hide without sending; does nothing if the banner is not showing."""
+        if self._on_accept is None:
+            return
+        self._on_accept = None
+        self.hide()
+        self.cancelled.emit()
+
+    # ── helpers ──────────────────────────────────────────────────────────
+
+    def _accept(self) -> None:
+        callback = self._on_accept
+        if callback is None:
+            return
+        self._on_accept = None
+        self.hide()
+        callback()
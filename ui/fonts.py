@@ -0,0 +1,14 @@
+"""Shared font instances, built once and reused across widgets."""
+
+from functools import cache
+
+from PyQt6.QtGui import QFont
+
+
+MONO_FAMILY = "Menlo"
+
+
+@cache
+def mono_font(size: int) -> QFont:
+    """Monospace font at *size* points (created lazily, after QApplication)."""
+    return QFont(MONO_FAMILY, size)
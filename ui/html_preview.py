@@ -1,7 +1,8 @@
 """Side-by-side HTML code editor with live rendered preview."""
 
-from PyQt6.QtCore import Qt, QTimer
-from PyQt6.QtGui import QFont
+import json
+
+from PyQt6.QtCore import QSignalBlocker, Qt, QTimer
 from PyQt6.QtWebEngineWidgets import QWebEngineView
 from PyQt6.QtWidgets import (
     QHBoxLayout,
@@ -12,10 +13,34 @@ from PyQt6.QtWidgets import (
     QWidget,
 )
 
+from ui.fonts import mono_font
+
+
+# Preview debounce bounds (ms)
+_MIN_REFRESH_MS = 400
+_MAX_REFRESH_MS = 2000
+
 
 class HtmlEditorWidget(QWidget):
     """A widget with an HTML code editor on the left and live preview on the right."""
 
+    # Static document wrapped around the editor content in the preview
+    _WRAP_PREFIX = """<!DOCTYPE html>
+<html><head><meta charset="utf-8">
+<style>
+body {
+    font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif;
+    padding: 16px;
+    margin: 0;
+    color: #333;
+    background: #fff;
+    line-height: 1.6;
+}
+img { max-width: 100%; height: auto; }
+</style>
+</head><body>"""
+    _WRAP_SUFFIX = "</body></html>"
+
     def __init__(self, parent=None) -> None:
         super().__init__(parent)
 
@@ -33,7 +58,7 @@ class HtmlEditorWidget(QWidget):
         editor_layout.addWidget(editor_label)
 
         self.editor = QPlainTextEdit()
-        self.editor.setFont(QFont("Menlo", 12))
+        self.editor.setFont(mono_font(12))
         self.editor.setPlaceholderText("Paste or write your HTML email body here…")
         self.editor.setStyleSheet(
             """
@@ -69,6 +94,10 @@ class HtmlEditorWidget(QWidget):
         self.preview.setStyleSheet(
             "border: 1px solid #292e42; border-radius: 8px;"
         )
+        # Load the wrapper document once; refreshes only swap the body via JS
+        self._preview_ready = False
+        self.preview.loadFinished.connect(self._on_preview_loaded)
+        self.preview.setHtml(self._WRAP_PREFIX + self._WRAP_SUFFIX)
         preview_layout.addWidget(self.preview)
 
         # ── splitter ─────────────────────────────────────────────────
@@ -88,36 +117,37 @@ class HtmlEditorWidget(QWidget):
         # ── debounced preview refresh ────────────────────────────────
         self._refresh_timer = QTimer(self)
         self._refresh_timer.setSingleShot(True)
-        self._refresh_timer.setInterval(400)  # ms
+        self._refresh_timer.setInterval(_MIN_REFRESH_MS)
         self._refresh_timer.timeout.connect(self._update_preview)
         self.editor.textChanged.connect(self._schedule_refresh)
 
     # ── helpers ──────────────────────────────────────────────────────────
 
     def _schedule_refresh(self) -> None:
+        # Large documents take longer to render, so widen the debounce window
+        n = self.editor.document().characterCount()
+        self._refresh_timer.setInterval(
+            min(_MAX_REFRESH_MS, max(_MIN_REFRESH_MS, n // 500))
+        )
         self._refresh_timer.start()
 
+    def _on_preview_loaded(self, ok: bool) -> None:
+        self._preview_ready = ok
+        if ok:
+            self._update_preview()
+
     def _update_preview(self) -> None:
-        html = self.editor.toPlainText()
-        wrapped = f"""<!DOCTYPE html>
-<html><head><meta charset="utf-8">
-<style>
-body {{
-    font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif;
-    padding: 16px;
-    margin: 0;
-    color: #333;
-    background: #fff;
-    line-height: 1.6;
-}}
-img {{ max-width: 100%; height: auto; }}
-</style>
-</head><body>{html}</body></html>"""
-        self.preview.setHtml(wrapped)
+        if not self._preview_ready:
+            return  # _on_preview_loaded will render once the wrapper is up
+        self.preview.page().runJavaScript(
+            "document.body.innerHTML = " + json.dumps(self.editor.toPlainText())
+        )
 
     def get_html(self) -> str:
         return self.editor.toPlainText()
 
     def set_html(self, html: str) -> None:
-        self.editor.setPlainText(html)
+        # Render once directly rather than also via the debounced refresh
+        with QSignalBlocker(self.editor):
+            self.editor.setPlainText(html)
         self._update_preview()
@@ -2,19 +2,28 @@
 
 from __future__ import annotations
 
-import os
-from typing import List, Optional
-
-from PyQt6.QtCore import Qt
-from PyQt6.QtGui import QFont
+import re
+from functools import cache, partial
+from typing import List, Optional, Tuple
+
+from PyQt6.QtCore import Qt, QTimer
+from PyQt6.QtGui import (
+    QColor,
+    QFont,
+    QKeySequence,
+    QShortcut,
+    QTextCharFormat,
+    QTextCursor,
+)
 from PyQt6.QtWidgets import (
+    QAbstractItemView,
     QApplication,
     QFileDialog,
-    QFormLayout,
     QGroupBox,
     QHBoxLayout,
     QLabel,
     QLineEdit,
+    QListView,
     QMainWindow,
     QMessageBox,
     QPlainTextEdit,
@@ -23,25 +32,36 @@ from PyQt6.QtWidgets import (
     QDoubleSpinBox,
     QScrollArea,
     QSizePolicy,
-    QSpacerItem,
     QStatusBar,
-    QTextEdit,
     QVBoxLayout,
     QWidget,
 )
 
 from core.config import AppConfig
-from core.email_sender import EmailSenderWorker, EmailResult
+from core.email_sender import (
+    EmailResult,
+    EmailSenderWorker,
+    SendJob,
+    clean_recipients,
+)
+from ui.confirm_banner import ConfirmBanner
+from ui.fonts import mono_font
 from ui.html_preview import HtmlEditorWidget
+from ui.recipient_list import RecipientListModel, split_addresses
+
+
+# Older log lines are dropped beyond this count
+LOG_MAX_LINES = 2000
+LOG_FLUSH_MS = 50
+# Progress updates are coalesced and applied at most this often
+PROGRESS_FLUSH_MS = 50
+
+UI_FONT_FAMILIES = ["SF Pro Display", "Segoe UI", "Helvetica Neue", "Arial"]
 
 
 # ── Stylesheet ───────────────────────────────────────────────────────────────
 
 STYLESHEET = """
-* {
-    font-family: 'SF Pro Display', 'Segoe UI', 'Helvetica Neue', Arial, sans-serif;
-}
-
 QMainWindow {
     background-color: #0f0f14;
 }
@@ -50,16 +70,8 @@ QWidget#centralWidget {
     background-color: #0f0f14;
 }
 
-QScrollArea {
-    background-color: #0f0f14;
-    border: none;
-}
-QScrollArea > QWidget > QWidget {
-    background-color: #0f0f14;
-}
-
 /* ── Group Boxes ─────────────────────────────────────────── */
-QGroupBox {
+QGroupBox[role="card"] {
     background-color: #16161e;
     border: 1px solid #1e1e2e;
     border-radius: 12px;
@@ -69,7 +81,7 @@ QGroupBox {
     font-weight: 600;
     color: #c0caf5;
 }
-QGroupBox::title {
+QGroupBox[role="card"]::title {
     subcontrol-origin: margin;
     left: 16px;
     padding: 2px 10px;
@@ -78,7 +90,7 @@ QGroupBox::title {
 }
 
 /* ── Inputs ──────────────────────────────────────────────── */
-QLineEdit {
+QLineEdit[role="field"] {
     background-color: #1a1b26;
     border: 1px solid #292e42;
     border-radius: 8px;
@@ -88,18 +100,18 @@ QLineEdit {
     selection-background-color: #33467c;
     min-height: 18px;
 }
-QLineEdit:focus {
+QLineEdit[role="field"]:focus {
     border: 1px solid #7aa2f7;
     background-color: #1e2030;
 }
-QLineEdit:hover {
+QLineEdit[role="field"]:hover {
     border: 1px solid #3b4261;
 }
-QLineEdit::placeholder {
+QLineEdit[role="field"]::placeholder {
     color: #565f89;
 }
 
-QDoubleSpinBox {
+QDoubleSpinBox[role="field"] {
     background-color: #1a1b26;
     border: 1px solid #292e42;
     border-radius: 8px;
@@ -108,24 +120,25 @@ QDoubleSpinBox {
     color: #c0caf5;
     min-height: 18px;
 }
-QDoubleSpinBox:focus {
+QDoubleSpinBox[role="field"]:focus {
     border: 1px solid #7aa2f7;
 }
-QDoubleSpinBox::up-button, QDoubleSpinBox::down-button {
+QDoubleSpinBox[role="field"]::up-button,
+QDoubleSpinBox[role="field"]::down-button {
     width: 20px;
     border: none;
     background: #292e42;
     border-radius: 4px;
     margin: 2px;
 }
-QDoubleSpinBox::up-arrow {
+QDoubleSpinBox[role="field"]::up-arrow {
     image: none;
     border-left: 4px solid transparent;
     border-right: 4px solid transparent;
     border-bottom: 5px solid #7aa2f7;
     width: 0; height: 0;
 }
-QDoubleSpinBox::down-arrow {
+QDoubleSpinBox[role="field"]::down-arrow {
     image: none;
     border-left: 4px solid transparent;
     border-right: 4px solid transparent;
@@ -148,7 +161,19 @@ QPlainTextEdit:focus {
     border: 1px solid #7aa2f7;
 }
 
-QTextEdit#logView {
+QListView#recipientList {
+    background-color: #1a1b26;
+    border: 1px solid #292e42;
+    border-radius: 8px;
+    padding: 10px;
+    color: #c0caf5;
+    selection-background-color: #33467c;
+}
+QListView#recipientList:focus {
+    border: 1px solid #7aa2f7;
+}
+
+QPlainTextEdit#logView {
     background-color: #1a1b26;
     color: #9aa5ce;
     border: 1px solid #292e42;
@@ -202,11 +227,39 @@ QPushButton#loadFileBtn:hover {
     background-color: #afd68a;
 }
 
-QPushButton#clearListBtn {
+QPushButton#clearListBtn, QPushButton#pasteBtn, QPushButton#removeBtn {
     background-color: #292e42;
     color: #9aa5ce;
 }
-QPushButton#clearListBtn:hover {
+QPushButton#clearListBtn:hover, QPushButton#pasteBtn:hover,
+QPushButton#removeBtn:hover {
+    background-color: #3b4261;
+    color: #c0caf5;
+}
+
+/* ── Confirm Banner ──────────────────────────────────────── */
+QFrame#confirmBanner {
+    background-color: #1e2030;
+    border: 1px solid #7aa2f7;
+    border-radius: 8px;
+}
+QLabel#confirmText {
+    font-size: 12px;
+    color: #c0caf5;
+    background: transparent;
+}
+QPushButton#confirmAcceptBtn {
+    background-color: #7aa2f7;
+    color: #1a1b26;
+}
+QPushButton#confirmAcceptBtn:hover {
+    background-color: #89b4fa;
+}
+QPushButton#confirmCancelBtn {
+    background-color: #292e42;
+    color: #9aa5ce;
+}
+QPushButton#confirmCancelBtn:hover {
     background-color: #3b4261;
     color: #c0caf5;
 }
@@ -230,6 +283,21 @@ QProgressBar::chunk {
 }
 
 /* ── Labels ──────────────────────────────────────────────── */
+QLabel#headerTitle {
+    font-size: 24px;
+    font-weight: 700;
+    color: #c0caf5;
+    background: transparent;
+    padding: 0;
+    margin: 0;
+}
+QLabel#headerSubtitle {
+    font-size: 13px;
+    color: #565f89;
+    background: transparent;
+    padding: 0;
+    margin: 0 0 8px 0;
+}
 QLabel#fieldLabel {
     font-size: 12px;
     font-weight: 500;
@@ -259,6 +327,27 @@ QStatusBar {
 """
 
 
+def _minify_qss(qss: str) -> str:
+    """Strip comments and redundant whitespace so Qt has less to tokenize."""
+    qss = re.sub(r"/\*.*?\*/", "", qss, flags=re.S)
+    qss = re.sub(r"\s+", " ", qss)
+    qss = re.sub(r"\s*([{}:;,])\s*", r"\1", qss)
+    return qss.strip()
+
+
+# Computed once at import; STYLESHEET stays readable for maintenance
+_MINIFIED_STYLESHEET = _minify_qss(STYLESHEET)
+
+
+@cache
+def _char_format(color: Optional[str]) -> QTextCharFormat:
+    """Log text format in *color*, or the view's default colour for None."""
+    fmt = QTextCharFormat()
+    if color is not None:
+        fmt.setForeground(QColor(color))
+    return fmt
+
+
 class MainWindow(QMainWindow):
     """Top-level window for the Bulk Email Sender."""
 
@@ -269,18 +358,37 @@ class MainWindow(QMainWindow):
         self.resize(1060, 820)
 
         self.config = AppConfig()
-        self._worker: Optional[EmailSenderWorker] = None
+        # One long-lived sender thread; each send is queued to it as a job
+        self._worker = EmailSenderWorker()
+        # Always emitted from the worker thread, so queue explicitly rather
+        # than letting AutoConnection decide on every emission
+        queued = Qt.ConnectionType.QueuedConnection
+        self._worker.progress.connect(self._on_progress, queued)
+        self._worker.email_sent_batch.connect(self._on_emails_sent, queued)
+        self._worker.finished_all.connect(self._on_finished, queued)
+        self._worker.log_message.connect(self._log, queued)
+        self._worker.error_occurred.connect(self._on_error, queued)
+        self._worker.start()
+
+        # App-wide font instead of a universal `*` rule in the stylesheet;
+        # set before building so widgets are created with it
+        font = QFont()
+        font.setFamilies(UI_FONT_FAMILIES)
+        font.setPixelSize(13)
+        QApplication.instance().setFont(font)
 
         self._build_ui()
         self._restore_fields()
-        self.setStyleSheet(STYLESHEET)
+        self.setStyleSheet(_MINIFIED_STYLESHEET)
 
     # =====================================================================
     #  UI construction
     # =====================================================================
 
     def _build_ui(self) -> None:
-        # Scrollable central area
+        # Scrollable central area – only needed when the window is shorter
+        # than the content; the frame and backgrounds come from code and
+        # #centralWidget so no scroll-area stylesheet rules are required.
         scroll = QScrollArea()
         scroll.setWidgetResizable(True)
         scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
@@ -297,18 +405,12 @@ class MainWindow(QMainWindow):
 
         # ── Header ───────────────────────────────────────────────────
         header = QLabel("Bulk Email Sender")
-        header.setStyleSheet(
-            "font-size: 24px; font-weight: 700; color: #c0caf5;"
-            "background: transparent; padding: 0; margin: 0;"
-        )
+        header.setObjectName("headerTitle")
         header.setAlignment(Qt.AlignmentFlag.AlignLeft)
         root.addWidget(header)
 
         sub = QLabel("Send emails via Resend with anti-spam optimisations")
-        sub.setStyleSheet(
-            "font-size: 13px; color: #565f89; background: transparent;"
-            "padding: 0; margin: 0 0 8px 0;"
-        )
+        sub.setObjectName("headerSubtitle")
         root.addWidget(sub)
 
         # ── Row 1: Settings + Recipients side by side ────────────────
@@ -317,6 +419,7 @@ class MainWindow(QMainWindow):
 
         # -- Settings --
         settings_box = QGroupBox("Settings")
+        settings_box.setProperty("role", "card")
         sf = QVBoxLayout(settings_box)
         sf.setSpacing(12)
         sf.setContentsMargins(16, 24, 16, 16)
@@ -332,6 +435,7 @@ class MainWindow(QMainWindow):
         delay_label.setObjectName("fieldLabel")
         sf.addWidget(delay_label)
         self.delay_spin = QDoubleSpinBox()
+        self.delay_spin.setProperty("role", "field")
         self.delay_spin.setRange(1.0, 60.0)
         self.delay_spin.setValue(5.0)
         self.delay_spin.setSingleStep(0.5)
@@ -343,21 +447,43 @@ class MainWindow(QMainWindow):
 
         # -- Recipients --
         recip_box = QGroupBox("Recipients")
+        recip_box.setProperty("role", "card")
         rf = QVBoxLayout(recip_box)
         rf.setSpacing(8)
         rf.setContentsMargins(16, 24, 16, 16)
 
-        hint = QLabel("One email per line, or load from a file")
+        hint = QLabel("Type or paste emails and press Enter, or load from a file")
         hint.setObjectName("fieldLabel")
         rf.addWidget(hint)
 
-        self.recipient_edit = QPlainTextEdit()
-        self.recipient_edit.setPlaceholderText(
-            "alice@example.com\nbob@example.com\ncharlie@example.com"
+        self.recipient_input = QLineEdit()
+        self.recipient_input.setProperty("role", "field")
+        self.recipient_input.setPlaceholderText("alice@example.com, bob@example.com")
+        self.recipient_input.returnPressed.connect(self._add_from_input)
+        rf.addWidget(self.recipient_input)
+
+        # Virtualized view: only visible rows are laid out and painted
+        self._recip_model = RecipientListModel(self)
+        self.recipient_list = QListView()
+        self.recipient_list.setObjectName("recipientList")
+        self.recipient_list.setModel(self._recip_model)
+        self.recipient_list.setUniformItemSizes(True)
+        self.recipient_list.setFont(mono_font(12))
+        self.recipient_list.setMinimumHeight(140)
+        self.recipient_list.setSelectionMode(
+            QAbstractItemView.SelectionMode.ExtendedSelection
+        )
+        self.recipient_list.setEditTriggers(
+            QAbstractItemView.EditTrigger.DoubleClicked
+            | QAbstractItemView.EditTrigger.EditKeyPressed
         )
-        self.recipient_edit.setFont(QFont("Menlo", 12))
-        self.recipient_edit.setMinimumHeight(140)
-        rf.addWidget(self.recipient_edit, stretch=1)
+        for key in (QKeySequence.StandardKey.Delete, QKeySequence.StandardKey.Backspace):
+            QShortcut(
+                QKeySequence(key), self.recipient_list,
+                activated=self._remove_selected_recipients,
+                context=Qt.ShortcutContext.WidgetShortcut,
+            )
+        rf.addWidget(self.recipient_list, stretch=1)
 
         # Buttons row
         rbtn = QHBoxLayout()
@@ -368,9 +494,19 @@ class MainWindow(QMainWindow):
         self.load_file_btn.clicked.connect(self._load_recipients_file)
         rbtn.addWidget(self.load_file_btn)
 
+        self.paste_btn = QPushButton("Paste")
+        self.paste_btn.setObjectName("pasteBtn")
+        self.paste_btn.clicked.connect(self._paste_recipients)
+        rbtn.addWidget(self.paste_btn)
+
+        self.remove_btn = QPushButton("Remove")
+        self.remove_btn.setObjectName("removeBtn")
+        self.remove_btn.clicked.connect(self._remove_selected_recipients)
+        rbtn.addWidget(self.remove_btn)
+
         self.clear_btn = QPushButton("Clear")
         self.clear_btn.setObjectName("clearListBtn")
-        self.clear_btn.clicked.connect(lambda: self.recipient_edit.clear())
+        self.clear_btn.clicked.connect(self._recip_model.clear)
         rbtn.addWidget(self.clear_btn)
 
         rbtn.addStretch()
@@ -387,6 +523,7 @@ class MainWindow(QMainWindow):
 
         # ── Row 2: HTML Editor ───────────────────────────────────────
         html_box = QGroupBox("Email Body")
+        html_box.setProperty("role", "card")
         hf = QVBoxLayout(html_box)
         hf.setContentsMargins(16, 24, 16, 16)
         self.html_editor = HtmlEditorWidget()
@@ -396,6 +533,7 @@ class MainWindow(QMainWindow):
 
         # ── Row 3: Actions ───────────────────────────────────────────
         action_box = QGroupBox("Send")
+        action_box.setProperty("role", "card")
         af = QVBoxLayout(action_box)
         af.setSpacing(10)
         af.setContentsMargins(16, 24, 16, 16)
@@ -419,6 +557,10 @@ class MainWindow(QMainWindow):
 
         af.addLayout(btn_row)
 
+        # Inline confirmation, shown by _on_send instead of a modal dialog
+        self._confirm_banner = ConfirmBanner()
+        af.addWidget(self._confirm_banner)
+
         # Progress
         prog_row = QHBoxLayout()
         prog_row.setSpacing(10)
@@ -436,15 +578,33 @@ class MainWindow(QMainWindow):
 
         af.addLayout(prog_row)
 
+        # Latest (current, total) from the worker, applied by _flush_progress
+        self._progress_pending: Optional[Tuple[int, int]] = None
+        self._progress_shown: Optional[Tuple[int, int]] = None
+        self._progress_timer = QTimer(self)
+        self._progress_timer.setSingleShot(True)
+        self._progress_timer.setInterval(PROGRESS_FLUSH_MS)
+        self._progress_timer.timeout.connect(self._flush_progress)
+
         # Log
         log_label = QLabel("Log")
         log_label.setObjectName("fieldLabel")
         af.addWidget(log_label)
 
-        self.log_view = QTextEdit()
+        # Plain-text, append-only log with a bounded number of lines
+        self.log_view = QPlainTextEdit()
         self.log_view.setObjectName("logView")
         self.log_view.setReadOnly(True)
-        self.log_view.setFont(QFont("Menlo", 11))
+        self.log_view.setMaximumBlockCount(LOG_MAX_LINES)
+        self.log_view.setCenterOnScroll(False)
+        self.log_view.moveCursor(QTextCursor.MoveOperation.End)
+        # Lines are buffered and written in one go every LOG_FLUSH_MS
+        self._log_buf: List[Tuple[Tuple[str, QTextCharFormat], ...]] = []
+        self._log_flush_timer = QTimer(self)
+        self._log_flush_timer.setSingleShot(True)
+        self._log_flush_timer.setInterval(LOG_FLUSH_MS)
+        self._log_flush_timer.timeout.connect(self._flush_log)
+        self.log_view.setFont(mono_font(11))
         self.log_view.setFixedHeight(130)
         af.addWidget(self.log_view)
 
@@ -456,7 +616,27 @@ class MainWindow(QMainWindow):
         self.status_bar.showMessage("Ready")
 
         # ── Live count ───────────────────────────────────────────────
-        self.recipient_edit.textChanged.connect(self._update_count)
+        self._recip_model.modelReset.connect(self._update_count)
+        self._recip_model.rowsInserted.connect(self._update_count)
+        self._recip_model.rowsRemoved.connect(self._update_count)
+
+        # ── Pending confirmation ─────────────────────────────────────
+        # The banner offers a job built from the form as it was; any edit
+        # withdraws it so a stale job can never be sent.
+        banner = self._confirm_banner
+        banner.cancelled.connect(lambda: self.send_btn.setEnabled(True))
+        for field in (
+            self.api_key_input, self.from_name_input, self.from_email_input,
+            self.reply_to_input, self.subject_input,
+        ):
+            field.textChanged.connect(banner.dismiss)
+        self.delay_spin.valueChanged.connect(banner.dismiss)
+        self.html_editor.editor.textChanged.connect(banner.dismiss)
+        for signal in (
+            self._recip_model.modelReset, self._recip_model.rowsInserted,
+            self._recip_model.rowsRemoved, self._recip_model.dataChanged,
+        ):
+            signal.connect(banner.dismiss)
 
     # =====================================================================
     #  Helpers
@@ -473,6 +653,7 @@ class MainWindow(QMainWindow):
         lbl.setObjectName("fieldLabel")
         layout.addWidget(lbl)
         inp = QLineEdit()
+        inp.setProperty("role", "field")
         inp.setPlaceholderText(placeholder)
         if password:
             inp.setEchoMode(QLineEdit.EchoMode.Password)
@@ -480,13 +661,23 @@ class MainWindow(QMainWindow):
         return inp
 
     def _get_recipients(self) -> List[str]:
-        raw = self.recipient_edit.toPlainText()
-        return [line.strip() for line in raw.splitlines() if line.strip()]
+        return self._recip_model.items()
 
     def _update_count(self) -> None:
-        n = len(self._get_recipients())
+        n = self._recip_model.rowCount()
         self.count_label.setText(f"{n} recipient{'s' if n != 1 else ''}")
 
+    def _add_from_input(self) -> None:
+        self._recip_model.extend(split_addresses(self.recipient_input.text()))
+        self.recipient_input.clear()
+
+    def _paste_recipients(self) -> None:
+        self._recip_model.extend(split_addresses(QApplication.clipboard().text()))
+
+    def _remove_selected_recipients(self) -> None:
+        rows = self.recipient_list.selectionModel().selectedRows()
+        self._recip_model.remove(index.row() for index in rows)
+
     # =====================================================================
     #  Persist / restore
     # =====================================================================
@@ -500,20 +691,26 @@ class MainWindow(QMainWindow):
         self.delay_spin.setValue(self.config.delay_seconds)
         self.html_editor.set_html(self.config.html_body)
 
-    def _save_fields(self) -> None:
+    def _save_fields(self, html_body: Optional[str] = None) -> None:
+        """Store the form in config; pass *html_body* if already fetched."""
         self.config.api_key = self.api_key_input.text()
         self.config.from_name = self.from_name_input.text()
         self.config.from_email = self.from_email_input.text()
         self.config.reply_to = self.reply_to_input.text()
         self.config.subject = self.subject_input.text()
         self.config.delay_seconds = self.delay_spin.value()
-        self.config.html_body = self.html_editor.get_html()
+        if html_body is None:
+            html_body = self.html_editor.get_html()
+        self.config.html_body = html_body
 
     def closeEvent(self, event) -> None:  # noqa: N802
+        self._log_flush_timer.stop()
+        self._progress_timer.stop()
         self._save_fields()
-        if self._worker and self._worker.isRunning():
-            self._worker.request_stop()
-            self._worker.wait(3000)
+        # Hand edits to the writer now rather than after the debounce delay
+        self.config.flush()
+        self._worker.shutdown()
+        self._worker.wait(3000)
         super().closeEvent(event)
 
     # =====================================================================
@@ -528,18 +725,25 @@ class MainWindow(QMainWindow):
         if not path:
             return
         try:
-            with open(path, encoding="utf-8") as fh:
-                self.recipient_edit.setPlainText(fh.read())
+            self._stream_into_recipients(path)
             self._log(f"Loaded {path}")
         except Exception as exc:
             QMessageBox.warning(self, "Error", f"Could not read file:\n{exc}")
 
+    def _stream_into_recipients(self, path: str) -> None:
+        """Replace the recipient list with the non-blank lines of *path*."""
+        with open(path, encoding="utf-8") as fh:
+            items = [addr for line in fh if (addr := line.strip())]
+        self._recip_model.set_items(items)
+
     # =====================================================================
     #  Send / Stop
     # =====================================================================
 
     def _on_send(self) -> None:
-        self._save_fields()
+        # Serialise the editor once and reuse it for config and the worker
+        html_body = self.html_editor.get_html()
+        self._save_fields(html_body)
 
         recipients = self._get_recipients()
         if not recipients:
@@ -561,34 +765,30 @@ class MainWindow(QMainWindow):
             QMessageBox.warning(self, "Missing Subject", "Enter a subject line.")
             return
 
-        html_body = self.html_editor.get_html()
         if not html_body.strip():
             QMessageBox.warning(self, "Empty Body", "Write or paste HTML email content.")
             return
 
+        recipients, duplicates, invalid = clean_recipients(recipients)
+        if not recipients:
+            QMessageBox.warning(
+                self, "No Valid Recipients",
+                f"None of the addresses are valid ({invalid} invalid, "
+                f"{duplicates} duplicate).",
+            )
+            return
+
         total = len(recipients)
         delay = self.delay_spin.value()
-        est = total * delay
-        m, s = int(est // 60), int(est % 60)
-
-        answer = QMessageBox.question(
-            self,
-            "Confirm Send",
-            f"Send to {total} recipient(s)?\n"
-            f"Estimated time: {m}m {s}s\n\nContinue?",
-            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
-        )
-        if answer != QMessageBox.StandardButton.Yes:
-            return
 
-        self.log_view.clear()
-        self.progress_bar.setMaximum(total)
-        self.progress_bar.setValue(0)
-        self.progress_label.setText(f"0 / {total}")
-        self.send_btn.setEnabled(False)
-        self.stop_btn.setEnabled(True)
+        skipped = ""
+        if duplicates or invalid:
+            skipped = (
+                f"Skipping {duplicates} duplicate(s) and "
+                f"{invalid} invalid address(es)."
+            )
 
-        self._worker = EmailSenderWorker(
+        job = SendJob(
             api_key=api_key,
             from_name=self.from_name_input.text().strip(),
             from_email=from_email,
@@ -597,39 +797,73 @@ class MainWindow(QMainWindow):
             recipients=recipients,
             delay_seconds=delay,
             reply_to=self.reply_to_input.text().strip(),
+            total=total,
         )
-        self._worker.progress.connect(self._on_progress)
-        self._worker.email_sent.connect(self._on_email_sent)
-        self._worker.finished_all.connect(self._on_finished)
-        self._worker.log_message.connect(self._log)
-        self._worker.error_occurred.connect(self._on_error)
-        self._worker.start()
+        self.send_btn.setEnabled(False)
+        self._confirm_banner.show_for(
+            total, total * delay,
+            on_accept=partial(self._really_send, job),
+            note=skipped,
+        )
+
+    def _really_send(self, job: SendJob) -> None:
+        self._log_buf.clear()
+        self.log_view.clear()
+        self._progress_timer.stop()
+        self._progress_pending = None
+        self._progress_shown = (0, job.total)
+        self.progress_bar.setMaximum(job.total)
+        self.progress_bar.setValue(0)
+        self.progress_label.setText(f"0 / {job.total}")
+        self.send_btn.setEnabled(False)
+        self.stop_btn.setEnabled(True)
+
+        self._worker.submit(job)
         self.status_bar.showMessage("Sending…")
 
     def _on_stop(self) -> None:
-        if self._worker:
-            self._worker.request_stop()
-            self.stop_btn.setEnabled(False)
-            self._log("Stop requested — finishing current email…")
-            self.status_bar.showMessage("Stopping…")
+        self._worker.cancel_current_job()
+        self.stop_btn.setEnabled(False)
+        self._log("Stop requested — finishing current email…")
+        self.status_bar.showMessage("Stopping…")
 
     # =====================================================================
     #  Worker signal handlers
     # =====================================================================
 
     def _on_progress(self, current: int, total: int) -> None:
+        self._progress_pending = (current, total)
+        if not self._progress_timer.isActive():
+            self._progress_timer.start()
+
+    def _flush_progress(self) -> None:
+        """Apply the latest progress update if it differs from the shown one."""
+        pending = self._progress_pending
+        self._progress_pending = None
+        if pending is None or pending == self._progress_shown:
+            return
+        self._progress_shown = pending
+        current, total = pending
+        if total < 0:
+            # Unknown recipient count – show a busy indicator instead
+            self.progress_bar.setMaximum(0)
+            self.progress_label.setText(f"{current} done")
+            return
         self.progress_bar.setValue(current)
         self.progress_label.setText(f"{current} / {total}")
 
-    def _on_email_sent(self, result: EmailResult) -> None:
-        color = "#9ece6a" if result.success else "#f7768e"
-        icon = "✓" if result.success else "✗"
-        self.log_view.append(
-            f'<span style="color:{color}">{icon} {result.recipient}</span>'
-            f' — <span style="color:#565f89">{result.message}</span>'
-        )
+    def _on_emails_sent(self, results: List[EmailResult]) -> None:
+        for result in results:
+            if result.success:
+                head = (f"✓ {result.recipient}", _char_format("#9ece6a"))
+            else:
+                head = (f"✗ {result.recipient}", _char_format("#f7768e"))
+            tail = (f" — {result.message}", _char_format("#565f89"))
+            self._append_log_line(head, tail)
 
     def _on_finished(self, success: int, fail: int) -> None:
+        self._progress_timer.stop()
+        self._flush_progress()
         self.send_btn.setEnabled(True)
         self.stop_btn.setEnabled(False)
         self.status_bar.showMessage(f"Done — {success} sent, {fail} failed", 0)
@@ -645,7 +879,29 @@ class MainWindow(QMainWindow):
         QMessageBox.critical(self, "Error", msg)
 
     def _log(self, text: str) -> None:
-        self.log_view.append(text)
-        sb = self.log_view.verticalScrollBar()
-        if sb:
-            sb.setValue(sb.maximum())
+        self._append_log_line((text, _char_format(None)))
+
+    def _append_log_line(self, *parts: Tuple[str, QTextCharFormat]) -> None:
+        """Queue one line made of differently formatted text runs."""
+        self._log_buf.append(parts)
+        if not self._log_flush_timer.isActive():
+            self._log_flush_timer.start()
+
+    def _flush_log(self) -> None:
+        """Write all queued lines to the log view in a single edit."""
+        if not self._log_buf:
+            return
+        doc = self.log_view.document()
+        cursor = QTextCursor(doc)
+        cursor.movePosition(QTextCursor.MoveOperation.End)
+        cursor.beginEditBlock()
+        for parts in self._log_buf:
+            if not doc.isEmpty():
+                cursor.insertBlock()
+            for text, fmt in parts:
+                cursor.insertText(text, fmt)
+        cursor.endEditBlock()
+        self._log_buf.clear()
+        # The view's own cursor sits at the end and moves with the inserts,
+        # so this keeps the tail in view without querying the scrollbar.
+        self.log_view.ensureCursorVisible()
@@ -0,0 +1,99 @@
+"""List model that exposes a plain Python list of recipient addresses to Qt views."""
+
+import re
+from typing import Iterable, List, Optional
+
+from PyQt6.QtCore import QAbstractListModel, QModelIndex, Qt
+
+
+# Separators accepted when several addresses are typed or pasted at once
+_SPLIT_RE = re.compile(r"[\s,;]+")
+
+
+def split_addresses(text: str) -> List[str]:
+    """Split free-form text into non-empty address tokens."""
+    return [token for token in _SPLIT_RE.split(text) if token]
+
+
+class RecipientListModel(QAbstractListModel):
+    """
+    Editable model over a list of addresses.
+
+    ``set_items()`` adopts the given list without copying it and every
+    edit mutates that list in place, so large recipient lists are held only
+    once and ``items()`` is always the live list.  Copy it if a snapshot is
+    needed.
+    """
+
+    def __init__(self, parent=None) -> None:
+        super().__init__(parent)
+        self._items: List[str] = []
+
+    # ── Qt model API ─────────────────────────────────────────────────────
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:  # noqa: N802
+        return 0 if parent.isValid() else len(self._items)
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Optional[str]:
+        if role in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.EditRole) and index.isValid():
+            return self._items[index.row()]
+        return None
+
+    def flags(self, index: QModelIndex) -> Qt.ItemFlag:
+        flags = super().flags(index)
+        if index.isValid():
+            flags |= Qt.ItemFlag.ItemIsEditable
+        return flags
+
+    def setData(self, index: QModelIndex, value, role: int = Qt.ItemDataRole.EditRole) -> bool:  # noqa: N802
+        if role != Qt.ItemDataRole.EditRole or not index.isValid():
+            return False
+        value = str(value).strip()
+        if not value:
+            return False
+        self._items[index.row()] = value
+        self.dataChanged.emit(index, index, [role])
+        return True
+
+    def removeRows(self, row: int, count: int, parent: QModelIndex = QModelIndex()) -> bool:  # noqa: N802
+        if parent.isValid() or count <= 0 or row < 0 or row + count > len(self._items):
+            return False
+        self.beginRemoveRows(parent, row, row + count - 1)
+        del self._items[row:row + count]
+        self.endRemoveRows()
+        return True
+
+    # ── public ───────────────────────────────────────────────────────────
+
+    def items(self) -> List[str]:
+        return self._items
+
+    def set_items(self, items: List[str]) -> None:
+        self.beginResetModel()
+        self._items = items
+        self.endResetModel()
+
+    def extend(self, items: Iterable[str]) -> None:
+        items = list(items)
+        if not items:
+            return
+        first = len(self._items)
+        self.beginInsertRows(QModelIndex(), first, first + len(items) - 1)
+        self._items.extend(items)
+        self.endInsertRows()
+
+    def remove(self, rows: Iterable[int]) -> None:
+        """Remove the given row numbers, one contiguous run at a time."""
+        run_end = run_start = None
+        for row in sorted(set(rows), reverse=True):
+            if run_start is not None and row == run_start - 1:
+                run_start = row
+                continue
+            if run_start is not None:
+                self.removeRows(run_start, run_end - run_start + 1)
+            run_start = run_end = row
+        if run_start is not None:
+            self.removeRows(run_start, run_end - run_start + 1)
+
+    def clear(self) -> None:
+        self.set_items([])